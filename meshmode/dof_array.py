@@ -32,7 +32,7 @@ import numpy as np
 import loopy as lp
 
 from pytools import MovedFunctionDeprecationWrapper
-from pytools import single_valued, memoize_in
+from pytools import single_valued, memoize, memoize_in
 
 from meshmode.transform_metadata import (
             ConcurrentElementInameTag, ConcurrentDOFInameTag)
@@ -62,6 +62,149 @@ __doc__ = """
 
 # {{{ DOFArray
 
+def _find_arena_view(data: Tuple[Any, ...]) -> Optional[np.ndarray]:
+    """Return a flat :class:`numpy.ndarray` viewing the storage underlying
+    all of the group arrays in *data*, if they are C-contiguous
+    :class:`numpy.ndarray`\\ s of a single dtype laid out back-to-back in a
+    shared buffer (an "arena"), and *None* otherwise.
+    """
+    if not data:
+        return None
+
+    def root_base(ary):
+        while isinstance(ary.base, np.ndarray):
+            ary = ary.base
+        return ary
+
+    first = data[0]
+    if not isinstance(first, np.ndarray):
+        return None
+
+    root = root_base(first)
+    if not root.flags.c_contiguous or root.dtype != first.dtype:
+        return None
+
+    root_ptr = root.__array_interface__["data"][0]
+    ptr = first.__array_interface__["data"][0]
+    start, rem = divmod(ptr - root_ptr, first.itemsize)
+    if rem:
+        return None
+
+    total = 0
+    for subary in data:
+        if (not isinstance(subary, np.ndarray)
+                or subary.dtype != first.dtype
+                or not subary.flags.c_contiguous
+                or root_base(subary) is not root
+                or subary.__array_interface__["data"][0] != ptr):
+            return None
+
+        ptr += subary.nbytes
+        total += subary.size
+
+    if start + total > root.size:
+        return None
+
+    return root.reshape(-1)[start:start + total]
+
+
+_NUMBA_IBOP_KERNELS: dict = {}
+
+
+def _get_numba_ibop_kernel(f):
+    """Return a :mod:`numba`-compiled kernel applying the in-place operator
+    *f* group-by-group to two typed lists of 2D arrays (parallelized over
+    groups), or *None* if numba is not available or *f* is not covered.
+    Compiled kernels are cached per operator.
+    """
+    try:
+        return _NUMBA_IBOP_KERNELS[f]
+    except KeyError:
+        pass
+
+    try:
+        import numba
+    except ImportError:
+        kernel = None
+    else:
+        if f is op.iadd:
+            @numba.njit(parallel=True, cache=True)
+            def kernel(lhs_arys, rhs_arys):
+                for igrp in numba.prange(len(lhs_arys)):
+                    lhs_arys[igrp] += rhs_arys[igrp]
+        elif f is op.isub:
+            @numba.njit(parallel=True, cache=True)
+            def kernel(lhs_arys, rhs_arys):
+                for igrp in numba.prange(len(lhs_arys)):
+                    lhs_arys[igrp] -= rhs_arys[igrp]
+        elif f is op.imul:
+            @numba.njit(parallel=True, cache=True)
+            def kernel(lhs_arys, rhs_arys):
+                for igrp in numba.prange(len(lhs_arys)):
+                    lhs_arys[igrp] *= rhs_arys[igrp]
+        elif f is op.itruediv:
+            @numba.njit(parallel=True, cache=True)
+            def kernel(lhs_arys, rhs_arys):
+                for igrp in numba.prange(len(lhs_arys)):
+                    lhs_arys[igrp] /= rhs_arys[igrp]
+        else:
+            kernel = None
+
+    _NUMBA_IBOP_KERNELS[f] = kernel
+    return kernel
+
+
+_NUMEXPR_IBOP_EXPRS = {
+        op.iadd: "a + c",
+        op.isub: "a - c",
+        op.imul: "a * c",
+        op.itruediv: "a / c",
+        }
+
+# Below this size, numexpr's setup overhead outweighs its chunked,
+# multi-threaded evaluation.
+_NUMEXPR_MIN_SIZE = 2**16
+
+
+def _numexpr_ibop(f, subary, arg) -> bool:
+    """Try to apply the in-place operator *f* with scalar *arg* to *subary*
+    via :mod:`numexpr`, which evaluates in cache-sized chunks on multiple
+    threads without temporaries. Return *True* on success, *False* if the
+    operator/array is not covered or numexpr is unavailable.
+    """
+    expr = _NUMEXPR_IBOP_EXPRS.get(f)
+    if (expr is None
+            or not isinstance(subary, np.ndarray)
+            or subary.size < _NUMEXPR_MIN_SIZE):
+        return False
+
+    # Only handle float/complex arrays whose dtype can hold the result:
+    # numpy's in-place operators raise for non-representable results
+    # (e.g. integer /= 2, complex scalar into a real array), and that
+    # behavior must not depend on the array's size. Everything else
+    # falls back to numpy and raises as before.
+    if (not np.issubdtype(subary.dtype, np.inexact)
+            or np.result_type(subary.dtype, arg) != subary.dtype):
+        return False
+
+    try:
+        import numexpr as ne
+    except ImportError:
+        return False
+
+    # NOTE: numexpr caches the compiled expression by its string, so
+    # repeated calls do not re-parse.
+    ne.evaluate(expr, local_dict={"a": subary, "c": arg},
+            out=subary, casting="same_kind")
+    return True
+
+
+def _all_c_contiguous_ndarrays(data: Tuple[Any, ...]) -> bool:
+    return all(
+            isinstance(subary, np.ndarray) and subary.flags.c_contiguous
+            for subary in data)
+
+
 @with_container_arithmetic(
         bcast_obj_array=True,
         bcast_numpy_array=True,
@@ -125,6 +268,12 @@ class DOFArray:
         the array context given to :func:`array_context_for_pickling`.
     """
 
+    # Many DOFArray instances are alive at once during operator
+    # evaluation; slots keep them small and make attribute access a
+    # descriptor load instead of a dict lookup.
+    __slots__ = ("_array_context", "_data", "_n",
+            "_cached_arena", "_entry_dtype", "__weakref__")
+
     def __init__(self, actx: Optional[ArrayContext], data: Tuple[Any]):
         if __debug__:
             if not (actx is None or isinstance(actx, ArrayContext)):
@@ -135,6 +284,11 @@ class DOFArray:
 
         self._array_context = actx
         self._data = data
+        self._n = len(data)
+
+        # False indicates "not yet computed", cf. _flat_arena_view
+        self._cached_arena: Any = False
+        self._entry_dtype: Optional[np.dtype] = None
 
     # Tell numpy that we would like to do our own array math, thank you very much.
     # (numpy arrays have priority 0.)
@@ -144,9 +298,50 @@ class DOFArray:
     def array_context(self):
         return self._array_context
 
+    def _flat_arena_view(self) -> Optional[np.ndarray]:
+        """A flat view of the single shared buffer underlying the group
+        arrays, as computed by :func:`_find_arena_view`, or *None*. Allows
+        elementwise operations to run as one vectorized call on all
+        groups at once. Computed on first access.
+        """
+        arena = self._cached_arena
+        if arena is False:
+            arena = self._cached_arena = _find_arena_view(self._data)
+        return arena
+
     @property
     def entry_dtype(self):
-        return single_valued(subary.dtype for subary in self._data)
+        # memoized: _data is immutable, and this gets accessed on hot
+        # paths such as flatten
+        dtype = self._entry_dtype
+        if dtype is None:
+            # dtype uniformity across groups is an invariant, so the first
+            # group is representative; the full scan only runs under
+            # __debug__
+            dtype = self._entry_dtype = self._data[0].dtype
+            assert single_valued(
+                    subary.dtype for subary in self._data) == dtype
+        return dtype
+
+    @classmethod
+    def _from_flat(cls, actx: Optional[ArrayContext], flat: Any,
+            group_shapes: Iterable[Tuple[int, int]],
+            group_starts: np.ndarray) -> "DOFArray":
+        """Build a :class:`DOFArray` whose group arrays are zero-copy views
+        tiling the flat array *flat* (one shared allocation instead of one
+        per group). For :class:`numpy.ndarray` storage, the arena cache is
+        seeded up front so that flatten, in-place arithmetic and friends
+        take their single-vectorized-call fast paths without re-detection.
+        """
+        result = cls(actx, tuple(
+            flat[group_starts[igrp]:group_starts[igrp + 1]].reshape(nel, ndof)
+            for igrp, (nel, ndof) in enumerate(group_shapes)))
+
+        if (isinstance(flat, np.ndarray)
+                and flat.ndim == 1 and flat.flags.c_contiguous):
+            result._cached_arena = flat
+
+        return result
 
     @classmethod
     def from_list(cls, actx: Optional[ArrayContext], res_list) -> "DOFArray":
@@ -178,7 +373,7 @@ class DOFArray:
                 "Use actx.np.any(x) or actx.np.all(x)")
 
     def __len__(self):
-        return len(self._data)
+        return self._n
 
     def __getitem__(self, i):
         return self._data[i]
@@ -191,35 +386,54 @@ class DOFArray:
     # {{{ ndarray interface
 
     def _like_me(self, data):
-        return DOFArray(self.array_context, tuple(data))
+        if type(data) is not tuple:
+            data = tuple(data)
+        return DOFArray(self._array_context, data)
 
     @property
     def shape(self):
-        return (len(self),)
+        return (self._n,)
 
     @property
     def size(self):
-        return len(self)
+        return self._n
 
     def copy(self):
-        return self._like_me([subary.copy() for subary in self])
+        arena = self._flat_arena_view()
+        if arena is not None:
+            # single memcpy-equivalent into one new shared allocation
+            group_shapes = tuple(subary.shape for subary in self._data)
+            return DOFArray._from_flat(self._array_context, arena.copy(),
+                    group_shapes, _group_starts(group_shapes))
+
+        return self._like_me(tuple([subary.copy() for subary in self._data]))
 
     def fill(self, value):
-        for subary in self:
-            subary.fill(value)
+        arena = self._flat_arena_view()
+        if arena is not None:
+            arena.fill(value)
+        else:
+            for subary in self:
+                subary.fill(value)
 
     def conj(self):
-        return self._like_me([subary.conj() for subary in self])
+        arena = self._flat_arena_view()
+        if arena is not None:
+            group_shapes = tuple(subary.shape for subary in self._data)
+            return DOFArray._from_flat(self._array_context, arena.conj(),
+                    group_shapes, _group_starts(group_shapes))
+
+        return self._like_me(tuple([subary.conj() for subary in self._data]))
 
     conjugate = conj
 
     @property
     def real(self):
-        return self._like_me([subary.real for subary in self])
+        return self._like_me(tuple([subary.real for subary in self._data]))
 
     @property
     def imag(self):
-        return self._like_me([subary.imag for subary in self])
+        return self._like_me(tuple([subary.imag for subary in self._data]))
 
     # }}}
 
@@ -232,15 +446,38 @@ class DOFArray:
                 "They will be removed in 2022.", DeprecationWarning, stacklevel=3)
 
         if isinstance(arg, DOFArray):
-            if len(self) != len(arg):
+            # no length check needed for self-ops such as x *= x
+            if arg is not self and len(self) != len(arg):
                 raise ValueError("'DOFArray' objects in binary operator must "
                         "have the same length: {len(self)} != {len(arg)}")
 
+            # NOTE: the numba kernels handle neither broadcasting nor
+            # numpy's shape-mismatch errors, so require exactly matching
+            # group shapes and leave everything else to the numpy loop
+            if (len(self) > 1
+                    and _all_c_contiguous_ndarrays(self._data)
+                    and _all_c_contiguous_ndarrays(arg._data)
+                    and self.entry_dtype == arg.entry_dtype
+                    and all(a.shape == b.shape
+                        for a, b in zip(self._data, arg._data))):
+                kernel = _get_numba_ibop_kernel(f)
+                if kernel is not None:
+                    from numba.typed import List
+                    kernel(List(self._data), List(arg._data))
+                    return self
+
             for i, subary in enumerate(self):
                 f(subary, arg[i])
         elif isinstance(arg, Number):
-            for subary in self:
-                f(subary, arg)
+            arena = self._flat_arena_view()
+            if arena is not None:
+                # one vectorized call on all groups at once
+                if not _numexpr_ibop(f, arena, arg):
+                    f(arena, arg)
+            else:
+                for subary in self:
+                    if not _numexpr_ibop(f, subary, arg):
+                        f(subary, arg)
         else:
             raise NotImplementedError(f"operation for type {type(arg).__name__}")
 
@@ -272,13 +509,25 @@ class DOFArray:
 
         # Make sure metadata inference has been done
         # https://github.com/inducer/meshmode/pull/318#issuecomment-1088320970
-        ary = self.array_context.thaw(self.array_context.freeze(self))
-
-        if self.array_context is not actx:
-            ary = actx.thaw(actx.freeze(self))
+        # NOTE: a single freeze/thaw round-trip through the pickling actx
+        # both triggers metadata inference and moves the data into *actx*
+        # if self.array_context differs from it.
+        ary = actx.thaw(actx.freeze(self))
 
         d = {}
-        d["data"] = [actx.to_numpy(ary_i) for ary_i in ary._data]
+
+        arena = ary._flat_arena_view() if len(ary) > 1 else None
+        if arena is not None:
+            # one batched transfer instead of one per group
+            flat = actx.to_numpy(arena)
+            group_shapes = tuple(subary.shape for subary in ary._data)
+            group_starts = _group_starts(group_shapes)
+            d["data"] = [
+                    flat[group_starts[igrp]:group_starts[igrp + 1]]
+                    .reshape(group_shapes[igrp])
+                    for igrp in range(len(group_shapes))]
+        else:
+            d["data"] = [actx.to_numpy(ary_i) for ary_i in ary._data]
 
         d["tags"] = [getattr(ary_i, "tags", frozenset()) for ary_i in ary]
 
@@ -301,6 +550,8 @@ class DOFArray:
                     "array_context_for_pickling is active.")
 
         self._array_context = actx
+        self._cached_arena = False
+        self._entry_dtype = None
 
         if isinstance(state, dict):
             data = state["data"]
@@ -333,6 +584,7 @@ class DOFArray:
             self._data.append(d)
 
         self._data = tuple(self._data)
+        self._n = len(self._data)
 
     # }}}
 
@@ -357,20 +609,24 @@ def _serialize_dof_container(ary: DOFArray):
     return enumerate(ary._data)
 
 
+def _raise_index_inconsistency(i, stream_i):
+    raise ValueError(
+            "out-of-sequence indices supplied in DOFArray deserialization "
+            f"(expected {i}, received {stream_i})")
+
+
 @deserialize_container.register(DOFArray)
 def _deserialize_dof_container(
         template: Any, iterable: Iterable[Tuple[Any, Any]]):
+    # NOTE: deserialization runs once per DOFArray inside every container
+    # traversal, so this avoids rebuilding the index-check closure per
+    # call and uses list comprehensions for the tuple construction.
     if __debug__:
-        def _raise_index_inconsistency(i, stream_i):
-            raise ValueError(
-                    "out-of-sequence indices supplied in DOFArray deserialization "
-                    f"(expected {i}, received {stream_i})")
-
         return type(template)(
                 template.array_context,
-                data=tuple(
+                data=tuple([
                     v if i == stream_i else _raise_index_inconsistency(i, stream_i)
-                    for i, (stream_i, v) in enumerate(iterable)))
+                    for i, (stream_i, v) in enumerate(iterable)]))
     else:
         return type(template)(
                 template.array_context,
@@ -390,6 +646,12 @@ def rec_map_dof_array_container(f: Callable[[Any], Any], ary):
     Similar to :func:`~arraycontext.map_array_container`, but
     does not further recurse on :class:`DOFArray`\ s.
     """
+    # Bare DOFArrays are by far the most common input (e.g. every
+    # flatten/unflatten of a single field): skip the container-dispatch
+    # machinery for them.
+    if isinstance(ary, DOFArray):
+        return f(ary)
+
     def rec(_ary):
         if isinstance(_ary, DOFArray):
             return f(_ary)
@@ -418,6 +680,9 @@ def rec_multimap_dof_array_container(f: Callable[[Any], Any], *args):
     Similar to :func:`~arraycontext.multimap_array_container`, but
     does not further recurse on :class:`DOFArray`\ s.
     """
+    if all(isinstance(arg, DOFArray) for arg in args):
+        return f(*args)
+
     from arraycontext.container.traversal import _multimap_array_container_impl
     return _multimap_array_container_impl(
             f, *args, leaf_cls=DOFArray, recursive=True)
@@ -435,7 +700,7 @@ def multimapped_over_dof_arrays(f):
 
 # {{{ flatten / unflatten       /!\ deprecated
 
-def _flatten_dof_array(ary: Any, strict: bool = True):
+def _flatten_dof_array(ary: Any, strict: bool = True, out: Any = None):
     if not isinstance(ary, DOFArray):
         if strict:
             raise TypeError(f"non-DOFArray type '{type(ary).__name__}' cannot "
@@ -447,51 +712,203 @@ def _flatten_dof_array(ary: Any, strict: bool = True):
     if actx is None:
         raise ValueError("cannot flatten frozen DOFArrays")
 
-    @memoize_in(actx, (_flatten_dof_array, "flatten_grp_ary_prg"))
-    def prg():
-        t_unit = make_loopy_program(
-            [
-                "{[iel]: 0 <= iel < nelements}",
-                "{[idof]: 0 <= idof < ndofs_per_element}"
-            ],
-            """
-                result[iel * ndofs_per_element + idof] = grp_ary[iel, idof]
-            """,
-            [
-                lp.GlobalArg("result", None,
-                             shape="nelements * ndofs_per_element"),
-                lp.GlobalArg("grp_ary", None,
-                             shape=("nelements", "ndofs_per_element")),
-                lp.ValueArg("nelements", np.int32),
-                lp.ValueArg("ndofs_per_element", np.int32),
-                "..."
-            ],
-            name="flatten_grp_ary"
-        )
-        return lp.tag_inames(t_unit, {
-            "iel": ConcurrentElementInameTag(),
-            "idof": ConcurrentDOFInameTag()})
-
-    def _flatten(grp_ary):
-        # If array has two axes, assume they are elements/dofs. If C-contiguous
-        # in those, "flat" and "unflat" memory layout agree.
+    if out is not None:
+        # Reuse the caller-provided buffer: write the groups into it,
+        # skipping the per-call allocation.
+        group_shapes = tuple(grp_ary.shape for grp_ary in ary)
+        group_starts = _group_starts(group_shapes)
+        if out.size != group_starts[-1]:
+            raise ValueError("cannot flatten into 'out': "
+                    f"has size {out.size}, expected {group_starts[-1]}")
+        if out.dtype != ary.entry_dtype:
+            raise ValueError("cannot flatten into 'out': "
+                    f"has dtype '{out.dtype}', expected '{ary.entry_dtype}'")
+
+        if _should_fix_fused_prg(group_shapes):
+            # write all groups into the buffer with a single fused launch
+            kwargs = {
+                f"grp_ary_{igrp}": grp_ary
+                for igrp, grp_ary in enumerate(ary)}
+            actx.call_loopy(
+                    _flatten_fused_prg_fixed(actx, group_shapes),
+                    result=out, **kwargs)
+        else:
+            # With runtime element counts, the groups' grids cannot be
+            # fused into a single launch (the grid size would be a
+            # multi-valued expression): write each group into its slice
+            # of the buffer with one launch per group.
+            for igrp, grp_ary in enumerate(ary):
+                actx.call_loopy(
+                        _flatten_fused_prg(actx, (grp_ary.shape[1],)),
+                        result=out, grp_ary_0=grp_ary,
+                        grp_start_0=group_starts[igrp],
+                        nresult=group_starts[-1])
+        return out
+
+    arena = ary._flat_arena_view()
+    if arena is not None:
+        # The group arrays already tile a single buffer in flat layout:
+        # no copy needed. (Same aliasing caveat as the single-group
+        # ravel below.)
+        return arena
+
+    if len(ary) == 1:
+        # If the array has two axes, assume they are elements/dofs. If
+        # C-contiguous in those, "flat" and "unflat" memory layout agree
+        # and no copy is needed.
         try:
-            return actx.np.ravel(grp_ary, order="C")
+            return actx.np.ravel(ary[0], order="C")
         except ValueError:
             # NOTE: array has unsupported strides
             return actx.call_loopy(
-                prg(),
-                grp_ary=grp_ary
-            )["result"]
+                    _flatten_fused_prg(actx, (ary[0].shape[1],)),
+                    grp_ary_0=ary[0], grp_start_0=0,
+                    nresult=ary[0].shape[0] * ary[0].shape[1])["result"]
 
-    if len(ary) == 1:
-        # can avoid a copy if reshape succeeds
-        return _flatten(ary[0])
-    else:
-        return actx.np.concatenate([_flatten(grp_ary) for grp_ary in ary])
+    try:
+        flat_subarys = [actx.np.ravel(grp_ary, order="C") for grp_ary in ary]
+    except ValueError:
+        # NOTE: at least one group array has unsupported strides
+        group_shapes = tuple(grp_ary.shape for grp_ary in ary)
+
+        if _should_fix_fused_prg(group_shapes):
+            # copy all groups with a single fused kernel launch
+            kwargs = {
+                f"grp_ary_{igrp}": grp_ary
+                for igrp, grp_ary in enumerate(ary)}
+            return actx.call_loopy(
+                    _flatten_fused_prg_fixed(actx, group_shapes),
+                    **kwargs)["result"]
+
+        # With runtime element counts, the groups' grids cannot be fused
+        # into a single launch (the grid size would be a multi-valued
+        # expression): copy each group into its slice of the result with
+        # one launch per group.
+        group_starts = _group_starts(group_shapes)
+        result = None
+        for igrp, grp_ary in enumerate(ary):
+            kwargs = {
+                "grp_ary_0": grp_ary,
+                "grp_start_0": group_starts[igrp],
+                "nresult": group_starts[-1]}
+            if result is not None:
+                kwargs["result"] = result
+            result = actx.call_loopy(
+                    _flatten_fused_prg(actx, (grp_ary.shape[1],)),
+                    **kwargs)["result"]
+
+        return result
+
+    return actx.np.concatenate(flat_subarys)
+
+
+_FLATTEN_FUSED_PRG_KEY = (_flatten_dof_array, "flatten_fused_prg")
+
+# Baking element counts and offsets into the fused copy kernels (in
+# addition to the dof counts) is only worthwhile for small groups, where
+# loop and launch overhead dominate and the compiler can unroll/tile the
+# whole copy; for large groups it would just recompile per mesh size.
+_FUSED_PRG_FIX_MAX_NELEMENTS = 256
+_FUSED_PRG_FIX_MAX_NDOFS = 32
+
+
+def _should_fix_fused_prg(group_shapes: Tuple[Tuple[int, int], ...]) -> bool:
+    return all(
+            nel <= _FUSED_PRG_FIX_MAX_NELEMENTS
+            and ndof <= _FUSED_PRG_FIX_MAX_NDOFS
+            for nel, ndof in group_shapes)
+
+
+def _fix_fused_prg_parameters(t_unit,
+        group_shapes: Tuple[Tuple[int, int], ...], total_name: str):
+    """Specialize a fused flatten/unflatten program to fixed element counts
+    and start offsets (*total_name* is the program's total-size parameter).
+    """
+    fix: dict = {}
+    grp_start = 0
+    for igrp, (nel, ndof) in enumerate(group_shapes):
+        fix[f"nelements_{igrp}"] = nel
+        fix[f"grp_start_{igrp}"] = grp_start
+        grp_start += nel * ndof
+    fix[total_name] = grp_start
+
+    return lp.fix_parameters(t_unit, **fix)
+
+
+def _flatten_fused_prg(actx: ArrayContext, group_ndofs: Tuple[int, ...]):
+    """Return a loopy program that flattens all group arrays of a
+    :class:`DOFArray` in a single launch, memoized on *actx*.
+
+    The program is specialized on the per-group dof counts *group_ndofs*
+    (compile-time constants, so the inner dof loop can be unrolled and
+    vectorized), while element counts and start offsets remain runtime
+    parameters so that meshes of different sizes share one compiled
+    kernel per dof-count signature.
+
+    Since the launch grid must be single-valued, this runtime-parameter
+    variant is only used with a single group per launch; only
+    :func:`_flatten_fused_prg_fixed` (where the grid sizes are
+    compile-time constants) fuses all groups into one launch.
+    """
+    @memoize_in(actx, (*_FLATTEN_FUSED_PRG_KEY, group_ndofs))
+    def prg():
+        return _build_flatten_fused_prg(group_ndofs)
+
+    return prg()
 
 
-def flatten(ary: ArrayOrContainerT, *, strict: bool = True) -> ArrayOrContainerT:
+def _flatten_fused_prg_fixed(
+        actx: ArrayContext, group_shapes: Tuple[Tuple[int, int], ...]):
+    """Like :func:`_flatten_fused_prg`, but with element counts and start
+    offsets baked in as well, cf. :func:`_should_fix_fused_prg`.
+    """
+    @memoize_in(actx, (*_FLATTEN_FUSED_PRG_KEY, group_shapes))
+    def prg():
+        return _fix_fused_prg_parameters(
+                _build_flatten_fused_prg(
+                    tuple(ndof for _, ndof in group_shapes)),
+                group_shapes, "nresult")
+
+    return prg()
+
+
+def _build_flatten_fused_prg(group_ndofs: Tuple[int, ...]):
+    domains = []
+    insns = []
+    args: list = [lp.GlobalArg("result", None, shape="nresult")]
+    inames = {}
+
+    for igrp, ndofs_per_element in enumerate(group_ndofs):
+        domains.append(
+                "{[iel_%(igrp)d, idof_%(igrp)d]: "
+                "0 <= iel_%(igrp)d < nelements_%(igrp)d "
+                "and 0 <= idof_%(igrp)d < %(ndof)d}"
+                % {"igrp": igrp, "ndof": ndofs_per_element})
+        # NOTE: the groups write provably disjoint slices of *result*,
+        # so no synchronization between their instructions is needed
+        insns.append(
+                "result[grp_start_%(igrp)d"
+                " + iel_%(igrp)d * %(ndof)d + idof_%(igrp)d]"
+                " = grp_ary_%(igrp)d[iel_%(igrp)d, idof_%(igrp)d]"
+                " {id=flatten_grp_%(igrp)d, no_sync_with=flatten_grp_*@any}"
+                % {"igrp": igrp, "ndof": ndofs_per_element})
+        args.append(lp.GlobalArg(f"grp_ary_{igrp}", None,
+            shape=(f"nelements_{igrp}", ndofs_per_element)))
+        args.append(lp.ValueArg(f"grp_start_{igrp}", np.intp))
+        inames[f"iel_{igrp}"] = ConcurrentElementInameTag()
+        inames[f"idof_{igrp}"] = ConcurrentDOFInameTag()
+
+    args.append(lp.ValueArg("nresult", np.intp))
+    args.append("...")
+
+    t_unit = make_loopy_program(
+        domains, "\n".join(insns), args,
+        name="flatten_dof_array_fused")
+    return lp.tag_inames(t_unit, inames)
+
+
+def flatten(ary: ArrayOrContainerT, *, strict: bool = True,
+        out: Any = None) -> ArrayOrContainerT:
     r"""Convert all :class:`DOFArray`\ s into a "flat" array of degrees of
     freedom, where the resulting type of the array is given by the
     :attr:`DOFArray.array_context`.
@@ -509,11 +926,21 @@ def flatten(ary: ArrayOrContainerT, *, strict: bool = True) -> ArrayOrContainerT
     :arg strict: if *True*, only :class:`DOFArray`\ s are allowed as leaves
         in the container *ary*. If *False*, any non-:class:`DOFArray` are
         left as is.
+    :arg out: if given, a preallocated array of matching size and dtype
+        that receives the flattened degrees of freedom, avoiding a fresh
+        allocation per call. Only supported when *ary* is a
+        :class:`DOFArray`.
     """
     warn("meshmode.dof_array.flatten is deprecated and should be replaced "
             "by using arraycontext.flatten. It will be removed in 2022.",
             DeprecationWarning, stacklevel=2)
 
+    if out is not None:
+        if not isinstance(ary, DOFArray):
+            raise ValueError("'out' is only supported when flattening "
+                    "a single DOFArray, not a container")
+        return _flatten_dof_array(ary, strict=strict, out=out)
+
     def _flatten(subary):
         return _flatten_dof_array(subary, strict=strict)
 
@@ -531,24 +958,111 @@ def _unflatten_dof_array(actx: ArrayContext, ary: Any,
         else:
             return ary
 
-    @memoize_in(actx, (_unflatten_dof_array, "unflatten_prg"))
-    def prg():
-        t_unit = make_loopy_program(
-            "{[iel,idof]: 0<=iel<nelements and 0<=idof<ndofs_per_element}",
-            "result[iel, idof] = ary[grp_start + iel*ndofs_per_element + idof]",
-            name="unflatten")
-        return lp.tag_inames(t_unit, {
-            "iel": ConcurrentElementInameTag(),
-            "idof": ConcurrentDOFInameTag()})
+    if isinstance(ary, np.ndarray) and ary.flags.c_contiguous:
+        # NOTE: "flat" and "unflat" memory layout agree, so the group
+        # arrays can be zero-copy views into the flat array.
+        return DOFArray._from_flat(actx, ary.reshape(-1), group_shapes,
+                group_starts)
 
+    group_shapes = tuple(group_shapes)
+
+    if _should_fix_fused_prg(group_shapes):
+        # pull all groups out of the flat array with a single launch
+        result = actx.call_loopy(
+                _unflatten_fused_prg_fixed(actx, group_shapes), ary=ary)
+        return DOFArray(actx, tuple(
+            result[f"grp_ary_{igrp}"] for igrp in range(len(group_shapes))))
+
+    # With runtime element counts, the groups' grids cannot be fused into
+    # a single launch (the grid size would be a multi-valued expression):
+    # pull each group out of the flat array with one launch per group.
     return DOFArray(actx, tuple(
         actx.call_loopy(
-            prg(),
-            grp_start=grp_start, ary=ary,
-            nelements=nel,
-            ndofs_per_element=ndof,
-            )["result"]
-        for grp_start, (nel, ndof) in zip(group_starts, group_shapes)))
+            _unflatten_fused_prg(actx, (ndof,)),
+            ary=ary, nelements_0=nel,
+            grp_start_0=group_starts[igrp])["grp_ary_0"]
+        for igrp, (nel, ndof) in enumerate(group_shapes)))
+
+
+_UNFLATTEN_FUSED_PRG_KEY = (_unflatten_dof_array, "unflatten_fused_prg")
+
+
+def _unflatten_fused_prg(actx: ArrayContext, group_ndofs: Tuple[int, ...]):
+    """Return a loopy program that unflattens a flat array into group
+    arrays, memoized on *actx*.
+
+    Specialized on the per-group dof counts *group_ndofs* only; element
+    counts and start offsets are runtime parameters. As with
+    :func:`_flatten_fused_prg`, this runtime-parameter variant is only
+    used with a single group per launch; only
+    :func:`_unflatten_fused_prg_fixed` fuses all groups into one launch.
+    """
+    @memoize_in(actx, (*_UNFLATTEN_FUSED_PRG_KEY, group_ndofs))
+    def prg():
+        return _build_unflatten_fused_prg(group_ndofs)
+
+    return prg()
+
+
+def _unflatten_fused_prg_fixed(
+        actx: ArrayContext, group_shapes: Tuple[Tuple[int, int], ...]):
+    """Like :func:`_unflatten_fused_prg`, but with element counts and start
+    offsets baked in as well, cf. :func:`_should_fix_fused_prg`.
+    """
+    @memoize_in(actx, (*_UNFLATTEN_FUSED_PRG_KEY, group_shapes))
+    def prg():
+        return _fix_fused_prg_parameters(
+                _build_unflatten_fused_prg(
+                    tuple(ndof for _, ndof in group_shapes)),
+                group_shapes, "nary")
+
+    return prg()
+
+
+def _build_unflatten_fused_prg(group_ndofs: Tuple[int, ...]):
+    domains = []
+    insns = []
+    args: list = [lp.GlobalArg("ary", None, shape="nary")]
+    inames = {}
+
+    for igrp, ndofs_per_element in enumerate(group_ndofs):
+        domains.append(
+                "{[iel_%(igrp)d, idof_%(igrp)d]: "
+                "0 <= iel_%(igrp)d < nelements_%(igrp)d "
+                "and 0 <= idof_%(igrp)d < %(ndof)d}"
+                % {"igrp": igrp, "ndof": ndofs_per_element})
+        insns.append(
+                "grp_ary_%(igrp)d[iel_%(igrp)d, idof_%(igrp)d]"
+                " = ary[grp_start_%(igrp)d"
+                " + iel_%(igrp)d * %(ndof)d + idof_%(igrp)d]"
+                % {"igrp": igrp, "ndof": ndofs_per_element})
+        args.append(lp.GlobalArg(f"grp_ary_{igrp}", None,
+            shape=(f"nelements_{igrp}", ndofs_per_element)))
+        args.append(lp.ValueArg(f"grp_start_{igrp}", np.intp))
+        inames[f"iel_{igrp}"] = ConcurrentElementInameTag()
+        inames[f"idof_{igrp}"] = ConcurrentDOFInameTag()
+
+    args.append(lp.ValueArg("nary", np.intp))
+    args.append("...")
+
+    t_unit = make_loopy_program(
+        domains, "\n".join(insns), args,
+        name="unflatten_dof_array_fused")
+    return lp.tag_inames(t_unit, inames)
+
+
+@memoize
+def _group_starts(group_shapes: Tuple[Tuple[int, int], ...]) -> np.ndarray:
+    """Compute the starting offsets of each group (plus the total size as
+    a final entry) in the flat array layout used by :func:`flatten`.
+
+    Memoized: in time-stepping loops the same group shapes recur on
+    every flatten/unflatten call.
+    """
+    group_starts = np.empty(len(group_shapes) + 1, dtype=np.intp)
+    group_starts[0] = 0
+    np.cumsum([nel * ndof for nel, ndof in group_shapes], out=group_starts[1:])
+    return group_starts
 
 
 def _unflatten_group_sizes(discr, ndofs_per_element_per_group):
@@ -556,15 +1070,12 @@ def _unflatten_group_sizes(discr, ndofs_per_element_per_group):
         ndofs_per_element_per_group = [
                 grp.nunit_dofs for grp in discr.groups]
 
-    group_shapes = [
+    group_shapes = tuple(
             (grp.nelements, ndofs_per_element)
             for grp, ndofs_per_element
-            in zip(discr.groups, ndofs_per_element_per_group)]
-
-    group_sizes = [nel * ndof for nel, ndof in group_shapes]
-    group_starts = np.cumsum([0] + group_sizes)
+            in zip(discr.groups, ndofs_per_element_per_group))
 
-    return group_shapes, group_starts
+    return group_shapes, _group_starts(group_shapes)
 
 
 def unflatten(
@@ -642,9 +1153,8 @@ def unflatten_like(
 
     def _unflatten_like(_ary, _prototype):
         if isinstance(_prototype, DOFArray):
-            group_shapes = [subary.shape for subary in _prototype]
-            group_sizes = [subary.size for subary in _prototype]
-            group_starts = np.cumsum([0] + group_sizes)
+            group_shapes = tuple(subary.shape for subary in _prototype)
+            group_starts = _group_starts(group_shapes)
 
             return _unflatten_dof_array(
                     actx, _ary, group_shapes, group_starts,
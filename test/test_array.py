@@ -79,9 +79,22 @@ def test_flatten_unflatten(actx_factory):
     a = np.random.randn(discr.ndofs)
 
     from meshmode.dof_array import flatten, unflatten
-    a_round_trip = actx.to_numpy(flatten(unflatten(actx, discr, actx.from_numpy(a))))
+    a_unflat = unflatten(actx, discr, actx.from_numpy(a))
+    a_round_trip = actx.to_numpy(flatten(a_unflat))
     assert np.array_equal(a, a_round_trip)
 
+    # flatten into a caller-provided buffer
+    a_out = actx.zeros(discr.ndofs, a.dtype)
+    a_flat = flatten(a_unflat, out=a_out)
+    assert a_flat is a_out
+    assert np.array_equal(a, actx.to_numpy(a_out))
+
+    with pytest.raises(ValueError):
+        flatten(a_unflat, out=actx.zeros(discr.ndofs + 1, a.dtype))
+
+    with pytest.raises(ValueError):
+        flatten(a_unflat, out=actx.zeros(discr.ndofs, np.float32))
+
     from meshmode.dof_array import flatten_to_numpy, unflatten_from_numpy
     a_round_trip = flatten_to_numpy(actx, unflatten_from_numpy(actx, discr, a))
     assert np.array_equal(a, a_round_trip)
@@ -101,6 +114,33 @@ def test_flatten_unflatten(actx_factory):
     assert flat_norm(c - c_round_trip) < 1.0e-8
 
 
+def test_flatten_unflatten_multigroup(actx_factory):
+    actx = actx_factory()
+
+    if isinstance(actx_factory, PytestPytatoPyOpenCLArrayContextFactory):
+        pytest.skip()
+
+    # groups of different sizes and dof counts, large enough to exercise
+    # the runtime-parameter (one launch per group) copy kernels
+    group_arys = [np.random.randn(300, 4), np.random.randn(280, 7)]
+    ary = DOFArray(actx, tuple(actx.from_numpy(a) for a in group_arys))
+
+    from meshmode.dof_array import flatten, unflatten_like
+    a_flat = flatten(ary)
+    a_expected = np.concatenate([a.ravel() for a in group_arys])
+    assert np.array_equal(actx.to_numpy(a_flat), a_expected)
+
+    ary_round_trip = unflatten_like(actx, a_flat, ary)
+    for a, a_round_trip in zip(group_arys, ary_round_trip):
+        assert np.array_equal(a, actx.to_numpy(a_round_trip))
+
+    # flatten into a caller-provided buffer
+    a_out = actx.zeros(a_expected.size, a_expected.dtype)
+    a_flat = flatten(ary, out=a_out)
+    assert a_flat is a_out
+    assert np.array_equal(a_expected, actx.to_numpy(a_out))
+
+
 # }}}
 
 